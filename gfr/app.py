@@ -1,4 +1,6 @@
 import typer
+# Command modules import questionary, python-dotenv and the GitHub API wrapper
+# inside their callbacks, so loading every command here stays cheap.
 from gfr.commands import (
     hello, create,
     init, addmicro,
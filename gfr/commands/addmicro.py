@@ -1,10 +1,8 @@
 import typer
-import questionary
 import os
 from rich.console import Console
 from rich.prompt import Prompt
 
-from gfr.utils.github.api import GitHubAPI
 from gfr.utils.github.exceptions import GitHubError
 from gfr.utils.git.operations import GitOperations, GitError
 
@@ -19,6 +17,9 @@ def main(
     Creates a new GitHub repository for a microservice, initializes it,
     and adds it as a submodule to the current project.
     """
+    import questionary
+    from gfr.utils.github.api import GitHubAPI
+
     try:
         # --- Initialize APIs ---
         git_ops = GitOperations()
@@ -1,11 +1,9 @@
 import typer
-import questionary
 from rich.console import Console
-from rich.prompt import Prompt
-from dotenv import load_dotenv
+from rich.prompt import Prompt, Confirm
 import os
 
-from gfr.utils.github.api import GitHubAPI, GitHubError
+from gfr.utils.github.exceptions import GitHubError
 from gfr.utils.git.operations import GitOperations
 from gfr.utils.config import GFRConfig
 
@@ -18,6 +16,9 @@ def main():
     """
     Creates a new GitHub repository in your organization.
     """
+    from dotenv import load_dotenv
+    from gfr.utils.github.api import GitHubAPI
+
     try:
         # --- Initialize APIs ---
         git_ops = GitOperations()
@@ -46,18 +47,7 @@ def main():
         description = Prompt.ask("\n[bold cyan]Enter repository description[/bold cyan]")
 
         # --- Get Repository Visibility ---
-        is_private = questionary.select(
-            "Select repository visibility:",
-            choices=[
-                {"name": "Public", "value": False},
-                {"name": "Private", "value": True},
-            ],
-            use_indicator=True
-        ).ask()        
-        
-        if is_private is None:
-            console.print("[bold red]No selection made. Aborting.[/bold red]")
-            raise typer.Exit()
+        is_private = Confirm.ask("[bold cyan]Make repository private?[/bold cyan]", default=False)
 
         readmefile = Prompt.ask("Do you want to add a readme file?", choices=['y', 'n'], default='n').lower() == 'y'
 
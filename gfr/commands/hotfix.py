@@ -2,7 +2,13 @@ import typer
 from typing_extensions import Annotated
 import os
 import re
-from datetime import datetime
+import shutil
+import sys
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 
@@ -10,38 +16,134 @@ from gfr.utils.command_helpers import validate_and_get_repo_details, format_git_
 from gfr.utils.console import get_multiline_input
 from gfr.utils.config import GFRConfig
 from gfr.utils.git.operations import GitOperations, GitError
-from gfr.utils.github.api import GitHubAPI, GitHubError
+from gfr.utils.github.exceptions import GitHubError
 from gfr.assets.changelog import CHANGELOG_TEMPLATE
 
+if TYPE_CHECKING:
+    from gfr.utils.github.api import GitHubAPI
+
 app = typer.Typer(name="hotfix", help="Start or finish a hotfix.", no_args_is_help=True)
 console = Console()
 
+# Matches the 'major.minor.patch' core of a tag, ignoring any pre-release/build suffix
+_VERSION_RE = re.compile(r'^v?(\d+)\.(\d+)\.(\d+)')
+
 def _get_next_patch_version(current_version: str) -> str:
     """Calculates the next patch version number."""
-    if not current_version:
+    match = _VERSION_RE.match(current_version or '')
+    if not match:
         # Cannot create a patch without a prior version
         return "0.0.1"
 
-    major, minor, patch = map(int, current_version.lstrip('v').split('.'))
-    patch += 1
-    return f"{major}.{minor}.{patch}"
+    major, minor, patch = match.groups()
+    return f"{major}.{minor}.{int(patch) + 1}"
 
 def _prompt_for_changelog_items() -> list[str]:
     """Prompts the user for a list of changes for the 'Fixed' category."""
     console.print(f"\n[bold cyan]Enter 'Fixed' items for the changelog (one per line, empty line to finish):[/bold cyan]")
     items = []
+    if not sys.stdin.isatty():
+        # Piped input: read straight from the buffered stream. Stop at the first empty line
+        # instead of reading to EOF, since the PR description follows on the same stream.
+        for line in iter(sys.stdin.readline, ''):
+            item = line.rstrip('\r\n')
+            if not item:
+                break
+            items.append(item)
+        return items
+
     while True:
-        item = input()
+        try:
+            item = input()
+        except EOFError:
+            # Ctrl+D finishes the list as well
+            break
         if not item:
             break
         items.append(item)
     return items
 
+_MERGE_CONFLICT = "conflict"
+
+# Prefix of the placeholder hotfix branch used until the issue number is known
+_PENDING_HOTFIX_PREFIX = "__pending_hotfix__"
+
+def _merge_main_into_branches(git_ops: GitOperations, branches: list[str], path: str, jobs: int) -> dict[str, str | None]:
+    """
+    Merges 'main' into each branch in parallel, using one temporary worktree per branch
+    so the main working tree is never switched away.
+
+    Returns a dict mapping each branch to None on success, _MERGE_CONFLICT if the merge
+    conflicted (and was aborted), or the error message otherwise. Nothing is printed here
+    so that console output stays on the main thread.
+    """
+    worktrees_root = tempfile.mkdtemp(prefix="gfr-hotfix-")
+
+    def merge_into(index: int, branch: str) -> str | None:
+        worktree_path = os.path.join(worktrees_root, str(index))
+        try:
+            git_ops.add_worktree(worktree_path, branch, path=path)
+        except GitError as e:
+            return str(e)
+        try:
+            git_ops.merge_branch_locally("main", path=worktree_path)
+            return None
+        except GitError as e:
+            try:
+                # Aborting only succeeds when the merge stopped on conflicts.
+                git_ops.merge_abort(path=worktree_path)
+                return _MERGE_CONFLICT
+            except GitError:
+                return str(e)
+        finally:
+            try:
+                git_ops.remove_worktree(worktree_path, force=True, path=path)
+            except GitError:
+                pass
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(branches)))) as executor:
+            futures = {branch: executor.submit(merge_into, i, branch) for i, branch in enumerate(branches)}
+            return {branch: future.result() for branch, future in futures.items()}
+    finally:
+        shutil.rmtree(worktrees_root, ignore_errors=True)
+
+def _insert_changelog_entry(changelog_path: str, new_entry: str):
+    """
+    Inserts a new entry after the intro paragraph that follows the '# Changelog' header.
+
+    The file is streamed line by line into a sibling temp file which then replaces the
+    original, so only the header section is ever held in memory.
+    """
+    tmp_path = changelog_path + ".tmp"
+    with open(changelog_path, 'r') as src:
+        try:
+            with open(tmp_path, 'w') as dst:
+                # 0: looking for the header, 1: expecting the blank line after it, 2: inside the intro paragraph
+                state = 0
+                for line in src:
+                    dst.write(line)
+                    is_blank = line in ("\n", "\r\n")
+                    if state == 0:
+                        state = 1 if line.rstrip("\r\n") == "# Changelog" else 0
+                    elif state == 1:
+                        state = 2 if is_blank else 0
+                    elif is_blank:
+                        dst.write(new_entry + "\n")
+                        shutil.copyfileobj(src, dst)
+                        break
+            os.replace(tmp_path, changelog_path)
+        except BaseException:
+            # Don't leave the temp file behind for a later 'ggg add .' to pick up
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
 def _start_hotfix(
     microservice_name: str,
     hotfix_name: str,
     git_ops: GitOperations,
-    github_api: GitHubAPI,
+    github_api: "GitHubAPI",
     config: GFRConfig
 ):
     """Handles the logic for starting a new hotfix."""
@@ -53,21 +155,37 @@ def _start_hotfix(
         console.print(f"[bold red]Error:[/bold red] You must be on the 'main' branch in '{target_name}' to start a hotfix. You are currently on '{current_branch}'.")
         raise typer.Exit(code=1)
 
-    with console.status(f"[bold yellow]Starting hotfix '{hotfix_name}'...[/bold yellow]", spinner="dots") as status:
-        # --- Create GitHub Issue ---
-        status.update(f"[bold yellow]Creating issue in '{repo_name_for_github}'...[/bold yellow]")
+    def create_issue():
         repo = github_api.repos.get(repo_name_for_github)
         issue_body = f"Hotfix to address: {hotfix_name}"
         labels = ["bug", "hotfix"]
-        issue = github_api.issues.create(repo, hotfix_name, issue_body, labels)
-        console.print(f"✔ Created hotfix issue [bold cyan]#{issue.number}[/bold cyan]: {issue.html_url}")
-
-        # --- Create and Switch to Branch from main ---
-        branch_name = f"hotfix/{issue.number}-{hotfix_name.lower().replace(' ', '-')}"
-        status.update(f"[bold yellow]Creating and switching to branch '{branch_name}' from 'main'...[/bold yellow]")
+        return github_api.issues.create(repo, hotfix_name, issue_body, labels)
 
-        git_ops.create_branch(branch_name, start_point="main", path=target_path)
-        git_ops.switch_branch(branch_name, path=target_path)
+    with console.status(f"[bold yellow]Starting hotfix '{hotfix_name}'...[/bold yellow]", spinner="dots") as status:
+        # --- Create GitHub Issue, branching from main locally in the meantime ---
+        status.update(f"[bold yellow]Creating issue in '{repo_name_for_github}'...[/bold yellow]")
+        # Unique per run, so a placeholder left by a crashed run can never block this one
+        pending_branch = f"{_PENDING_HOTFIX_PREFIX}{uuid.uuid4().hex[:8]}"
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                branch_future = executor.submit(git_ops.create_and_switch_branch, pending_branch, "main", path=target_path)
+                issue = create_issue()
+                branch_future.result()
+            console.print(f"✔ Created hotfix issue [bold cyan]#{issue.number}[/bold cyan]: {issue.html_url}")
+
+            # --- Give the Checked-out Branch its Final Name ---
+            branch_name = f"hotfix/{issue.number}-{hotfix_name.lower().replace(' ', '-')}"
+            status.update(f"[bold yellow]Renaming branch to '{branch_name}'...[/bold yellow]")
+            git_ops.rename_branch(pending_branch, branch_name, path=target_path)
+        except BaseException:
+            # The placeholder was branched from main, so switching back loses nothing
+            try:
+                if git_ops.get_current_branch(path=target_path) == pending_branch:
+                    git_ops.switch_branch("main", path=target_path)
+                git_ops.delete_local_branch(pending_branch, force=True, path=target_path)
+            except GitError:
+                pass
+            raise
         console.print(f"✔ Switched to new branch [bold yellow]{branch_name}[/bold yellow] in [bold cyan]{target_name}[/bold cyan].")
 
     config.set_last_used_microservice(target_path)
@@ -76,8 +194,9 @@ def _start_hotfix(
 def _finish_hotfix(
     microservice_name: str,
     git_ops: GitOperations,
-    github_api: GitHubAPI,
-    config: GFRConfig
+    github_api: "GitHubAPI",
+    config: GFRConfig,
+    jobs: int = 4
 ):
     """Handles the logic for finishing a hotfix."""
     target_path, target_name, repo_name_for_github = validate_and_get_repo_details(git_ops, config, microservice_name)
@@ -103,16 +222,15 @@ def _finish_hotfix(
     changelog_path = os.path.join(target_path, "CHANGELOG.md")
     remote_url = git_ops.get_remote_url(path=target_path)
     http_url = format_git_url_to_http(remote_url)
-    release_date = datetime.now().strftime("%Y-%m-%d")
+    release_date = date.today().isoformat()
     release_link = f"{http_url}/releases/tag/{tag_name}"
-    new_entry = f"## [{next_version}]({release_link}) - {release_date}\n### Fixed\n" + "\n".join(f"- {item}" for item in fixed_items) + "\n"
+    # Shared by the changelog entry and the GitHub release notes
+    bulleted_items = "\n".join(["- " + item for item in fixed_items])
+    new_entry = f"## [{next_version}]({release_link}) - {release_date}\n### Fixed\n" + bulleted_items + "\n"
 
-    if os.path.exists(changelog_path):
-        with open(changelog_path, 'r+') as f:
-            content = f.read()
-            f.seek(0, 0)
-            f.write(re.sub(r'(# Changelog\n\n.*?\n\n)', fr'\1{new_entry}\n', content, 1, re.DOTALL))
-    else:
+    try:
+        _insert_changelog_entry(changelog_path, new_entry)
+    except FileNotFoundError:
         with open(changelog_path, 'w') as f:
             f.write(CHANGELOG_TEMPLATE.strip() + "\n\n" + new_entry)
 
@@ -136,62 +254,73 @@ def _finish_hotfix(
 
     # --- Push, PR, and Merge into main and develop ---
     console.print(f"[bold yellow]Pushing branch '{current_branch}'...[/bold yellow]")
-    git_ops.push_branch(current_branch, set_upstream=True, path=target_path)
-    repo = github_api.repos.get(repo_name_for_github)
+    labels = ["bug", "hotfix"]
+    # The repository and node ID lookups don't depend on the push, so run them while it uploads
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        push_future = executor.submit(git_ops.push_branch, current_branch, set_upstream=True, path=target_path)
+        repo = github_api.repos.get(repo_name_for_github)
+        node_ids = github_api.prs.resolve_node_ids(repo, labels)
+        push_future.result()
 
-    for base_branch in ["main", "develop"]:
-        console.print(f"[bold yellow]Creating and merging PR to '{base_branch}'...[/bold yellow]")
-        pr = github_api.prs.create(repo, f"Hotfix: {current_branch}", pr_body, head=current_branch, base=base_branch, labels=["bug", "hotfix"])
-        github_api.prs.merge(pr)
-        console.print(f"✔ Merged PR to [bold yellow]{base_branch}[/bold yellow].")
+    console.print("[bold yellow]Creating and merging PRs to 'main' and 'develop'...[/bold yellow]")
+    merged_prs = github_api.prs.create_and_merge_many(repo, f"Hotfix: {current_branch}", pr_body, head=current_branch, bases=["main", "develop"], labels=labels, node_ids=node_ids)
+    for base_branch, pr in merged_prs.items():
+        console.print(f"✔ Merged PR [bold cyan]#{pr['number']}[/bold cyan] to [bold yellow]{base_branch}[/bold yellow].")
 
     # --- Sync local main and develop branches ---
     console.print("[bold yellow]Syncing local 'main' and 'develop' branches...[/bold yellow]")
+    git_ops.fetch(refs=["main", "develop"], path=target_path)
+    if git_ops.is_ancestor("develop", "origin/develop", path=target_path):
+        # Fast-forward 'develop' in place, without checking it out
+        git_ops.update_ref("refs/heads/develop", "origin/develop", path=target_path)
+    else:
+        # Local 'develop' has commits of its own, so merge as 'git pull' would
+        git_ops.switch_branch("develop", path=target_path)
+        git_ops.merge_branch_locally("origin/develop", path=target_path)
+    console.print("✔ Synced local 'develop' branch.")
     git_ops.switch_branch("main", path=target_path)
-    git_ops.pull("main", path=target_path)
+    git_ops.merge_branch_locally("origin/main", path=target_path)
     console.print("✔ Synced local 'main' branch.")
-    git_ops.switch_branch("develop", path=target_path)
-    git_ops.pull("develop", path=target_path)
-    console.print("✔ Synced local 'develop' branch.")
 
-    # --- Tagging and GitHub Release from main ---
+    # --- Tagging and GitHub Release from main (already checked out by the sync) ---
     console.print("[bold yellow]Tagging new release on 'main'...[/bold yellow]")
-    git_ops.switch_branch("main", path=target_path)
     git_ops.create_tag(tag_name, f"Release {next_version}", path=target_path)
-    git_ops.push_tags(path=target_path)
+    git_ops.push_branch("main", follow_tags=True, atomic=True, path=target_path)
     console.print(f"✔ Created and pushed tag [bold yellow]{tag_name}[/bold yellow].")
     
-    release_notes = f"## Changelog\n- " + "\n- ".join(fixed_items)
+    release_notes = "## Changelog\n" + bulleted_items
     github_api.repos.create_release(repo, tag_name, f"Release {next_version}", release_notes)
     console.print("✔ Created GitHub Release.")
     
     # --- Merging into other local branches ---
     console.print("[bold yellow]Merging hotfix into other local branches...[/bold yellow]")
     all_branches = git_ops.get_all_branches(path=target_path)
-    branches_to_merge_into = [b for b in all_branches if b not in ['main', 'develop', 'doc', current_branch] and not b.startswith('remotes/')]
-    
-    for branch in branches_to_merge_into:
-        try:
-            git_ops.switch_branch(branch, path=target_path)
-            git_ops.merge_branch_locally('main', path=target_path)
-            console.print(f"✔ Merged 'main' into local branch [bold yellow]{branch}[/bold yellow].")
-        except GitError as e:
-            if "merge conflict" in str(e).lower():
-                console.print(f"\n[bold yellow]Merge conflict detected in branch '{branch}'. The program will continue, but you must resolve this manually.[/bold yellow]")
+    candidates = [b for b in all_branches if b not in ['main', 'develop', 'doc', current_branch] and not b.startswith(_PENDING_HOTFIX_PREFIX)]
+    # Skip branches that already contain 'main' so they don't get a no-op merge
+    branches_to_merge_into = git_ops.branches_needing_merge('main', candidates, path=target_path)
+
+    if branches_to_merge_into:
+        results = _merge_main_into_branches(git_ops, branches_to_merge_into, target_path, jobs)
+        for branch, error in results.items():
+            if error is None:
+                console.print(f"✔ Merged 'main' into local branch [bold yellow]{branch}[/bold yellow].")
+            elif error == _MERGE_CONFLICT:
+                console.print(f"\n[bold yellow]Merge conflict detected in branch '{branch}'. The merge was aborted; you must merge it manually.[/bold yellow]")
                 console.print("To resolve:")
                 console.print(f"  1. In a separate terminal, navigate to the '{target_name}' directory.")
-                console.print(f"  2. Run 'git status' to see the conflicted files.")
-                console.print(f"  3. Open the files, resolve the conflicts, then save them.")
+                console.print(f"  2. Run 'git checkout {branch}' and then 'git merge main'.")
+                console.print(f"  3. Open the conflicted files shown by 'git status', resolve the conflicts, then save them.")
                 console.print(f"  4. Run 'ggg add {microservice_name} .' to stage the resolved files.")
                 console.print(f"  5. Run 'git commit' to complete the merge.")
             else:
-                console.print(f"[bold red]Could not auto-merge into '{branch}': {e}. Please merge manually.[/bold red]")
+                console.print(f"[bold red]Could not auto-merge into '{branch}': {error}. Please merge manually.[/bold red]")
 
     # --- Cleanup ---
     console.print("[bold yellow]Cleaning up branches...[/bold yellow]")
     git_ops.delete_remote_branch(current_branch, path=target_path)
     git_ops.delete_local_branch(current_branch, path=target_path)
-    git_ops.switch_branch("main", path=target_path)
+    if git_ops.get_current_branch(path=target_path) != "main":
+        git_ops.switch_branch("main", path=target_path)
     console.print(f"✔ Cleaned up branches and switched back to [bold yellow]main[/bold yellow].")
 
     config.set_last_used_microservice(target_path)
@@ -202,11 +331,14 @@ def _finish_hotfix(
 def hotfix(
     microservice_name: Annotated[str, typer.Argument(help="The target service (use '.' for parent, '-' for last used).")],
     action: Annotated[str, typer.Argument(help="The action to perform: 'start' or 'finish'.")],
-    hotfix_name: Annotated[str, typer.Argument(help="The name of the hotfix (e.g., 'Critical Security Patch'). Required for 'start'.")] = ""
+    hotfix_name: Annotated[str, typer.Argument(help="The name of the hotfix (e.g., 'Critical Security Patch'). Required for 'start'.")] = "",
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="Number of local branches to merge 'main' into in parallel when finishing.")] = 4
 ):
     """
     Manages the hotfix workflow: starts a new hotfix from main or finishes the current one.
     """
+    from gfr.utils.github.api import GitHubAPI
+
     try:
         git_ops = GitOperations()
         github_api = GitHubAPI()
@@ -218,7 +350,7 @@ def hotfix(
                 raise typer.Exit(code=1)
             _start_hotfix(microservice_name, hotfix_name, git_ops, github_api, config)
         elif action.lower() == "finish":
-            _finish_hotfix(microservice_name, git_ops, github_api, config)
+            _finish_hotfix(microservice_name, git_ops, github_api, config, jobs)
         else:
             console.print(f"Error: Invalid action '{action}'. Please use 'start' or 'finish'.")
             raise typer.Exit(code=1)
@@ -1,12 +1,9 @@
 import typer
-import questionary
 import os
 from rich.console import Console
 from rich.prompt import Prompt
-from dotenv import load_dotenv
 
 from gfr.utils.config import GFRConfig
-from gfr.utils.github.api import GitHubAPI
 from gfr.utils.github.exceptions import GitHubError
 from gfr.utils.git.operations import GitOperations, GitError
 
@@ -19,6 +16,10 @@ def main():
     Initializes the current directory as a Git repo, creates a corresponding
     GitHub repository, and sets up 'develop' and 'doc' branches.
     """
+    import questionary
+    from dotenv import load_dotenv
+    from gfr.utils.github.api import GitHubAPI
+
     try:
         # --- Initialize APIs ---
         git_ops = GitOperations()
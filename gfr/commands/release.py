@@ -1,17 +1,20 @@
 import typer
-import questionary
 import os
 import re
 from datetime import datetime
+from typing import TYPE_CHECKING
 from rich.console import Console
 
 from gfr.utils.git.operations import GitOperations, GitError
-from gfr.utils.github.api import GitHubAPI, GitHubError
+from gfr.utils.github.exceptions import GitHubError
 from gfr.utils.config import GFRConfig
 from gfr.utils.command_helpers import validate_and_get_repo_details, format_git_url_to_http
 from gfr.utils.console import get_multiline_input
 from gfr.assets.changelog import CHANGELOG_TEMPLATE
 
+if TYPE_CHECKING:
+    from gfr.utils.github.api import GitHubAPI
+
 app = typer.Typer(name="release", help="Start or finish a release.", no_args_is_help=True)
 console = Console()
 
@@ -52,6 +55,7 @@ def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name:
     console.print(f"Current version from tag: [bold yellow]{current_version or '0.0.0'}[/bold yellow]")
 
     # --- Ask for release type ---
+    import questionary
     release_type = questionary.select(
         "What type of release is this?",
         choices=["minor", "major"]
@@ -110,7 +114,7 @@ def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name:
     console.print("Review CHANGELOG.md, then run 'ggg add' and 'ggg commit'.")
 
 
-def _finish_release(git_ops: GitOperations, github_api: GitHubAPI, config: GFRConfig, microservice_name: str):
+def _finish_release(git_ops: GitOperations, github_api: "GitHubAPI", config: GFRConfig, microservice_name: str):
     """Handles the logic for finishing a release."""
     target_path, target_name, repo_name_for_github = validate_and_get_repo_details(git_ops, config, microservice_name)
     
@@ -181,6 +185,8 @@ def release(
     """
     Manages the release workflow by starting or finishing a release.
     """
+    from gfr.utils.github.api import GitHubAPI
+
     try:
         git_ops = GitOperations()
         github_api = GitHubAPI()
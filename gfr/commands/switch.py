@@ -1,5 +1,5 @@
 import typer
-import questionary
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 
 from gfr.utils.git.operations import GitOperations, GitError
@@ -16,17 +16,24 @@ def switch(
     """
     Switches to a different branch in the selected repository.
     """
+    import questionary
+
     try:
         git_ops = GitOperations()
         config = GFRConfig()
 
         target_path, target_name, _ = validate_and_get_repo_details(git_ops, config, microservice_name)
 
-        current_branch = git_ops.get_current_branch(path=target_path)
-        console.print(f"Currently on branch [bold yellow]{current_branch}[/bold yellow] in [bold cyan]{target_name}[/bold cyan].")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start listing branches in the background while the current branch is shown.
+            # It gets its own GitOperations so the two threads don't share repository handles.
+            branches_future = executor.submit(GitOperations().get_all_branches, include_remote=True, path=target_path)
+
+            current_branch = git_ops.get_current_branch(path=target_path)
+            console.print(f"Currently on branch [bold yellow]{current_branch}[/bold yellow] in [bold cyan]{target_name}[/bold cyan].")
 
-        with console.status("[bold yellow]Fetching branches...[/bold yellow]", spinner="dots"):
-            all_branches = git_ops.get_all_branches(path=target_path)
+            with console.status("[bold yellow]Fetching branches...[/bold yellow]", spinner="dots"):
+                all_branches = branches_future.result()
 
         if not all_branches:
             console.print("[bold red]Error:[/bold red] No branches found in the repository.")
@@ -5,7 +5,7 @@ import re
 from .console import get_multiline_input
 
 from .git.operations import GitOperations, GitError
-from .github.api import GitHubAPI, GitHubError
+from .github.exceptions import GitHubError
 from .config import GFRConfig
 
 console = Console()
@@ -48,6 +48,8 @@ def start_new_task(task_type: str, microservice_name: str, task_name: str):
     - Creates a GitHub issue.
     - Creates and switches to a new local branch.
     """
+    from .github.api import GitHubAPI
+
     try:
         git_ops = GitOperations()
         github_api = GitHubAPI()
@@ -98,6 +100,8 @@ def finish_task(task_type: str, microservice_name: str):
     - Creates and merges a pull request.
     - Cleans up the branch.
     """
+    from .github.api import GitHubAPI
+
     try:
         git_ops = GitOperations()
         github_api = GitHubAPI()
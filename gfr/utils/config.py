@@ -1,20 +1,48 @@
 # gfr/utils/config.py
+import functools
+import stat
+import tempfile
 import yaml
 import os
 from .git.operations import GitOperations, GitError
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # const values
 LAST_USED_MICROSERVICE = "last_used_microservice"
 ORGANIZATION = "organization"
 
+@functools.lru_cache(maxsize=16)
+def _cached_root(cwd: str) -> str:
+    """Returns the git root for a working directory, running 'git rev-parse' once per process."""
+    return GitOperations().get_root(cwd)
+
+@functools.lru_cache(maxsize=16)
+def _cached_config(config_path: str, mtime: float) -> dict:
+    """Parses a config file once per (path, modification time)."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+def _file_mode(path: str) -> int:
+    """Returns the permission bits of an existing file, or the umask default for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 class GFRConfig:
     """
     Manages the .gfr.yml configuration file at the root of the project.
     """
     def __init__(self):
         try:
-            git_ops = GitOperations()
-            self.root_path = git_ops.get_root()
+            self.root_path = _cached_root(os.getcwd())
             self.config_path = os.path.join(self.root_path, ".gfr.yml")
             self.config = self._read_config()
         except GitError:
@@ -25,16 +53,30 @@ class GFRConfig:
 
     def _read_config(self) -> dict:
         """Reads the YAML configuration file."""
-        if self.config_path and os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        if not self.config_path:
+            return {}
+        try:
+            # Copy so that changes to this instance don't leak into the shared cache
+            return dict(_cached_config(self.config_path, os.path.getmtime(self.config_path)))
+        except FileNotFoundError:
+            return {}
 
-    def _write_config(self):
-        """Writes the current configuration to the YAML file."""
-        if self.config_path:
-            with open(self.config_path, 'w') as f:
-                yaml.safe_dump(self.config, f)
+    def _write_config(self, path: str | None = None):
+        """Writes the current configuration to the YAML file (or to 'path', if given)."""
+        path = path or self.config_path
+        if path:
+            # Write to a sibling temp file and swap it in, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(prefix=".gfr.yml.", dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    yaml.dump(self.config, f, Dumper=SafeDumper)
+                # mkstemp creates the file as 0600; keep the mode a plain open() would give
+                os.chmod(tmp_path, _file_mode(path))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _cached_config.cache_clear()
 
     def get_last_used_microservice(self) -> str | None:
         """Retrieves the name of the last used microservice."""
@@ -48,8 +90,9 @@ class GFRConfig:
     def set_organization(self, organization: str):
         """update the organiztion we used for create and updating repository"""
         self.config[ORGANIZATION] = organization
-        with open(os.path.join(os.getcwd(), '.gfr.yml'), 'w') as f:
-            yaml.safe_dump(self.config, f)
+        # 'init' and 'create' set up a new repo in the current directory, which may sit
+        # inside another project, so write here rather than to an enclosing repo's root
+        self._write_config(os.path.join(os.getcwd(), ".gfr.yml"))
         
     def get_organization(self) -> str | None:
         """retrieves the name of the organiztion we use in this repo"""
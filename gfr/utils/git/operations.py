@@ -1,14 +1,53 @@
+import functools
 import subprocess
 import sys
 import os
 from .exceptions import GitError
 from .repo_status import RepoStatus
 
+@functools.lru_cache(maxsize=None)
+def _load_pygit2():
+    """
+    Imports pygit2 on first use, or returns None if it isn't installed.
+
+    pygit2 is optional: when installed, read-only lookups run in-process through
+    libgit2 instead of spawning a 'git' subprocess. It is imported lazily so that
+    commands which never reach those lookups (and '--help') don't load libgit2.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
 class GitOperations:
     """
     Handles the execution of local Git commands.
     """
 
+    def __init__(self):
+        # libgit2 repository handles, keyed by absolute path
+        self._repos = {}
+
+    def _open_repo(self, path: str = "."):
+        """
+        Returns a pygit2 Repository for the given path, or None if pygit2 is not
+        installed or the path is not inside a repository.
+        """
+        pygit2 = _load_pygit2()
+        if pygit2 is None:
+            return None
+        abs_path = os.path.abspath(path)
+        if abs_path not in self._repos:
+            try:
+                repo_path = pygit2.discover_repository(abs_path)
+                if not repo_path:
+                    return None
+                self._repos[abs_path] = pygit2.Repository(repo_path)
+            except pygit2.GitError:
+                return None
+        return self._repos[abs_path]
+
     def _run_command(self, command: list[str], cwd: str = ".", strip: bool = True):
         """
         A private helper to run git commands and handle errors.
@@ -65,25 +104,61 @@ class GitOperations:
         """Creates a new branch from a starting point."""
         self._run_command(["git", "branch", branch_name, start_point], cwd=path)
 
+    def create_and_switch_branch(self, branch_name: str, start_point: str = "HEAD", path: str = "."):
+        """Creates a new branch from a starting point and checks it out, in one command."""
+        self._run_command(["git", "checkout", "-b", branch_name, start_point], cwd=path)
+
+    def rename_branch(self, old_name: str, new_name: str, path: str = "."):
+        """Renames a local branch."""
+        self._run_command(["git", "branch", "-m", old_name, new_name], cwd=path)
+
     def switch_branch(self, branch_name: str, path: str = "."):
         """Switches to an existing branch."""
         self._run_command(["git", "checkout", branch_name], cwd=path)
 
-    def push_branch(self, branch_name: str, set_upstream: bool = False, path: str = "."):
-        """Pushes a branch to the 'origin' remote."""
-        cmd = ["git", "push", "origin", branch_name]
+    def push_branch(self, branch_name: str, set_upstream: bool = False, follow_tags: bool = False, atomic: bool = False, path: str = "."):
+        """
+        Pushes a branch to the 'origin' remote.
+
+        With follow_tags, annotated tags pointing into the pushed history go in the same
+        push; with atomic, the remote accepts either all of the refs or none of them.
+        """
+        cmd = ["git", "push"]
         if set_upstream:
-            cmd.insert(2, "-u")
+            cmd.append("-u")
+        if follow_tags:
+            cmd.append("--follow-tags")
+        if atomic:
+            cmd.append("--atomic")
+        cmd += ["origin", branch_name]
         self._run_command(cmd, cwd=path)
 
-    def fetch(self, remote: str = "origin", path: str = "."):
-        """Fetches updates from a remote repository."""
-        self._run_command(["git", "fetch", remote], cwd=path)
+    def fetch(self, remote: str = "origin", refs: list[str] | None = None, path: str = "."):
+        """
+        Fetches updates from a remote repository. If refs are given, only those are
+        fetched, all in a single round-trip, and their remote-tracking branches updated.
+        """
+        self._run_command(["git", "fetch", remote] + (refs or []), cwd=path)
+
+    def update_ref(self, ref: str, target: str, path: str = "."):
+        """Points a ref (e.g. 'refs/heads/develop') at a target without checking it out."""
+        self._run_command(["git", "update-ref", ref, target], cwd=path)
 
-    def clone(self, clone_url: str, repo_name: str, target_dir: str = ".") -> str:
+    def is_ancestor(self, ancestor: str, descendant: str, path: str = ".") -> bool:
+        """Checks whether 'ancestor' is reachable from 'descendant'."""
+        try:
+            self._run_command(["git", "merge-base", "--is-ancestor", ancestor, descendant], cwd=path)
+            return True
+        except GitError:
+            return False
+
+    def clone(self, clone_url: str, repo_name: str, target_dir: str = ".", filter_spec: str | None = "blob:none", jobs: int = 4, recurse_submodules: bool = True) -> str:
         """
         Clones a repository into a specific target directory.
         'git clone' will create a new folder named after the repo inside the target_dir.
+
+        By default this is a partial clone ('--filter=blob:none', blobs are fetched on
+        demand) and submodules are cloned with 'jobs' parallel fetches.
         """
         abs_target_dir = os.path.abspath(target_dir)
         final_repo_path = os.path.join(abs_target_dir, repo_name)
@@ -96,7 +171,13 @@ class GitOperations:
         except OSError as e:
             raise GitError(f"Could not create target directory '{abs_target_dir}': {e}")
 
-        self._run_command(["git", "clone", clone_url], cwd=abs_target_dir)
+        cmd = ["git", "clone"]
+        if filter_spec:
+            cmd.append(f"--filter={filter_spec}")
+        if recurse_submodules:
+            cmd += ["--recurse-submodules", f"--jobs={jobs}"]
+        cmd += [clone_url, repo_name]
+        self._run_command(cmd, cwd=abs_target_dir)
         return final_repo_path
 
     def add_submodule(self, repo_url: str, path: str, parent_path: str = "."):
@@ -131,6 +212,10 @@ class GitOperations:
         
     def get_current_branch(self, path: str = ".") -> str:
         """Gets the name of the current active branch."""
+        repo = self._open_repo(path)
+        if repo is not None and not repo.head_is_unborn:
+            # Matches 'git rev-parse --abbrev-ref HEAD', which prints 'HEAD' when detached
+            return "HEAD" if repo.head_is_detached else repo.head.shorthand
         return self._run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
     
     def push_all(self, path: str = "."):
@@ -182,6 +267,12 @@ class GitOperations:
         
     def get_remote_url(self, remote_name: str = "origin", path: str = ".") -> str:
         """Gets the URL of a specified remote."""
+        repo = self._open_repo(path)
+        if repo is not None:
+            try:
+                return repo.remotes[remote_name].url
+            except KeyError:
+                raise GitError(f"Remote '{remote_name}' not found.")
         return self._run_command(["git", "config", "--get", f"remote.{remote_name}.url"], cwd=path)
     
     def delete_remote_branch(self, branch_name: str, remote_name: str = "origin", path: str = "."):
@@ -216,20 +307,51 @@ class GitOperations:
         """Pushes all tags to the remote."""
         self._run_command(["git", "push", "--tags"], cwd=path)
         
-    def get_all_branches(self, path: str = ".") -> list[str]:
-        """Gets a list of all local and remote branches."""
-        # Get local branches
-        local_branches_output = self._run_command(["git", "branch"], cwd=path)
-        local_branches = [b.replace("* ", "").strip() for b in local_branches_output.splitlines()]
-
-        # Get remote branches
-        remote_branches_output = self._run_command(["git", "branch", "-r"], cwd=path)
-        remote_branches = [b.replace("origin/", "").strip() for b in remote_branches_output.splitlines() if '->' not in b]
+    def get_all_branches(self, include_remote: bool = False, path: str = ".") -> list[str]:
+        """
+        Gets a sorted list of local branch names. With include_remote, remote branches
+        are added too, with the 'origin/' prefix dropped so they merge with local names.
+        """
+        repo = self._open_repo(path)
+        if repo is not None:
+            branches = list(repo.branches.local)
+            if include_remote:
+                branches += [b for b in repo.branches.remote if not b.endswith("/HEAD")]
+        else:
+            # Plumbing equivalent of 'git branch [-a]', without markers to strip
+            refs = ["refs/heads/", "refs/remotes/"] if include_remote else ["refs/heads/"]
+            output = self._run_command(["git", "for-each-ref", "--format=%(refname:lstrip=2)"] + refs, cwd=path)
+            branches = [b for b in output.splitlines() if not b.endswith("/HEAD")]
 
-        # Combine and remove duplicates
-        all_branches = sorted(list(set(local_branches + remote_branches)))
-        return all_branches
+        return sorted({b.removeprefix("origin/") for b in branches})
 
     def merge_branch_locally(self, branch_to_merge: str, path: str = "."):
         """Merges a branch into the current checked-out branch."""
-        self._run_command(["git", "merge", branch_to_merge], cwd=path)
\ No newline at end of file
+        self._run_command(["git", "merge", branch_to_merge], cwd=path)
+
+    def branches_needing_merge(self, base: str, candidates: list[str], path: str = ".") -> list[str]:
+        """
+        Filters candidates down to the local branches whose tip does not already contain base,
+        using a single 'git for-each-ref --no-contains' instead of one check per branch.
+        """
+        output = self._run_command(
+            ["git", "for-each-ref", f"--no-contains={base}", "--format=%(refname:short)", "refs/heads/"],
+            cwd=path
+        )
+        needing_merge = set(output.splitlines())
+        return [b for b in candidates if b in needing_merge]
+
+    def merge_abort(self, path: str = "."):
+        """Aborts an in-progress merge and restores the pre-merge state."""
+        self._run_command(["git", "merge", "--abort"], cwd=path)
+
+    def add_worktree(self, worktree_path: str, branch_name: str, path: str = "."):
+        """Checks out an existing branch into a new linked worktree."""
+        self._run_command(["git", "worktree", "add", worktree_path, branch_name], cwd=path)
+
+    def remove_worktree(self, worktree_path: str, force: bool = False, path: str = "."):
+        """Removes a linked worktree."""
+        cmd = ["git", "worktree", "remove", worktree_path]
+        if force:
+            cmd.append("--force")
+        self._run_command(cmd, cwd=path)
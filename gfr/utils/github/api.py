@@ -3,9 +3,11 @@ from dotenv import load_dotenv
 from github import Github, GithubException
 
 # Import the manager and the custom exception
-from .repositories import RepositoryManager, GitHubError
+from .repositories import RepositoryManager
+from .exceptions import GitHubError
 from .pull_requests import PullRequestManager
 from .issues import IssueManager
+from .graphql import GraphQLClient
 from ..config import GFRConfig
 
 class GitHubAPI:
@@ -38,7 +40,13 @@ class GitHubAPI:
             error_tip = "\nPlease check your network connection and ensure your GITHUB_TOKEN is correct and has the required permissions."
             raise GitHubError(error_message + error_tip)
 
+        self._graphql = GraphQLClient(token)
+
         # --- Initialize and expose managers ---
         self.repos = RepositoryManager(self._gh, self._org)
         self.issues = IssueManager(self._gh, self._user)
-        self.prs = PullRequestManager(self._gh, self._user)
\ No newline at end of file
+        self.prs = PullRequestManager(self._gh, self._user, self._graphql)
+
+    def graphql(self, query: str, variables: dict | None = None) -> dict:
+        """Executes a raw GraphQL query or mutation and returns its data."""
+        return self._graphql.execute(query, variables)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import requests
+from .exceptions import GitHubError
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Seconds, matching PyGithub's default for REST calls
+REQUEST_TIMEOUT = 15
+
+class GraphQLClient:
+    """A minimal client for the GitHub GraphQL API."""
+    def __init__(self, token: str):
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"bearer {token}",
+            "Accept": "application/json",
+        })
+
+    def execute(self, query: str, variables: dict | None = None) -> dict:
+        """
+        Sends a single GraphQL query or mutation.
+
+        Args:
+            query (str): The GraphQL document to execute.
+            variables (dict): The variables referenced by the document.
+
+        Returns:
+            The 'data' object of the response.
+
+        Raises:
+            GitHubError: If the request fails or the response contains errors.
+        """
+        data, errors = self.execute_partial(query, variables)
+        if errors:
+            raise GitHubError(f"GraphQL request returned errors. Details: {'; '.join(errors)}")
+        return data
+
+    def execute_partial(self, query: str, variables: dict | None = None) -> tuple[dict, list[str]]:
+        """
+        Sends a single GraphQL query or mutation without treating field errors as fatal.
+
+        GraphQL still runs the remaining fields when one fails, so callers that batch
+        several mutations use this to see which of them went through.
+
+        Returns:
+            A tuple of the 'data' object (failed fields are None) and the error messages.
+
+        Raises:
+            GitHubError: If the request itself fails.
+        """
+        try:
+            response = self._session.post(GRAPHQL_URL, json={"query": query, "variables": variables or {}}, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            raise GitHubError(f"GraphQL request failed. Details: {e}")
+
+        if response.status_code != 200:
+            raise GitHubError(f"GraphQL request failed with status {response.status_code}. Details: {response.text}")
+
+        payload = response.json()
+        errors = [error.get("message", "Unknown error") for error in payload.get("errors") or []]
+        return payload.get("data") or {}, errors
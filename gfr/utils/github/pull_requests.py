@@ -1,11 +1,13 @@
 from github import Github, GithubException, Repository, AuthenticatedUser
 from .exceptions import GitHubError
+from .graphql import GraphQLClient
 
 class PullRequestManager:
     """Handles all actions related to GitHub Pull Requests."""
-    def __init__(self, gh: Github, user: AuthenticatedUser):
+    def __init__(self, gh: Github, user: AuthenticatedUser, graphql: GraphQLClient):
         self._gh = gh
         self._user = user
+        self._graphql = graphql
 
     def create(self, repo: Repository.Repository, title: str, body: str, head: str, base: str, labels: list[str]) -> 'PullRequest':
         """
@@ -41,3 +43,135 @@ class PullRequestManager:
             pr.merge()
         except GithubException as e:
             raise GitHubError(f"Failed to merge pull request. Details: {e.data.get('message', 'Unknown error')}")
+
+    def resolve_node_ids(self, repo: Repository.Repository, labels: list[str]) -> dict:
+        """
+        Resolves the GraphQL node IDs needed to open and label PRs, in a single query.
+
+        Args:
+            repo: The repository the PRs will be created in.
+            labels: A list of label names to look up.
+
+        Returns:
+            A dict with the 'repository_id', the 'label_ids' and 'assignee_ids' found,
+            and the 'missing_labels' that don't exist in the repository yet.
+        """
+        label_params = "".join(f", $label{i}: String!" for i in range(len(labels)))
+        label_fields = "".join(f" label{i}: label(name: $label{i}) {{ id }}" for i in range(len(labels)))
+        ids = self._graphql.execute(
+            f"query($owner: String!, $name: String!, $login: String!{label_params}) {{"
+            f" repository(owner: $owner, name: $name) {{ id{label_fields} }}"
+            f" user(login: $login) {{ id }} }}",
+            {"owner": repo.owner.login, "name": repo.name, "login": self._user.login,
+             **{f"label{i}": label for i, label in enumerate(labels)}},
+        )
+        repository = ids["repository"]
+        return {
+            "repository_id": repository["id"],
+            "label_ids": [repository[f"label{i}"]["id"] for i in range(len(labels)) if repository[f"label{i}"]],
+            "missing_labels": [label for i, label in enumerate(labels) if not repository[f"label{i}"]],
+            "assignee_ids": [ids["user"]["id"]] if ids.get("user") else [],
+        }
+
+    def create_and_merge_many(self, repo: Repository.Repository, title: str, body: str, head: str, bases: list[str], labels: list[str], node_ids: dict | None = None) -> dict[str, dict]:
+        """
+        Creates one pull request per base branch and merges them one after another.
+
+        All PRs are opened in one GraphQL mutation and labelled and assigned in a
+        second one. Each merge is then sent as its own request, and a merge only
+        happens once every earlier merge has succeeded. If a PR can't be created, or
+        labelling or assigning fails, every PR that was opened is closed again; if a
+        merge fails, the PRs not yet attempted are closed. Nothing lands in a later
+        base without landing in the earlier ones, and no PR is left open to block
+        the next attempt.
+
+        Args:
+            repo: The repository to create the PRs in.
+            title: The title of the PRs.
+            body: The description/body of the PRs.
+            head: The name of the source branch.
+            bases: The names of the target branches, in merge order.
+            labels: A list of label names to apply.
+            node_ids: The result of resolve_node_ids() for 'labels', if already fetched.
+
+        Returns:
+            A dict mapping each base branch to its PR's 'number' and 'url'.
+        """
+        if node_ids is None:
+            node_ids = self.resolve_node_ids(repo, labels)
+        label_ids = node_ids["label_ids"]
+        missing_labels = node_ids["missing_labels"]
+        assignee_ids = node_ids["assignee_ids"]
+
+        # --- Create all pull requests in one mutation ---
+        base_params = "".join(f", $base{i}: String!" for i in range(len(bases)))
+        create_fields = "".join(
+            f" pr{i}: createPullRequest(input: {{repositoryId: $repositoryId, title: $title, body: $body,"
+            f" headRefName: $head, baseRefName: $base{i}}}) {{ pullRequest {{ id number url }} }}"
+            for i in range(len(bases))
+        )
+        # A failed field doesn't stop the others, so inspect the partial result
+        created, errors = self._graphql.execute_partial(
+            f"mutation($repositoryId: ID!, $title: String!, $body: String!, $head: String!{base_params}) {{{create_fields} }}",
+            {"repositoryId": node_ids["repository_id"], "title": title, "body": body, "head": head,
+             **{f"base{i}": base for i, base in enumerate(bases)}},
+        )
+        pull_requests = [(created.get(f"pr{i}") or {}).get("pullRequest") for i in range(len(bases))]
+        if errors or not all(pull_requests):
+            self._close([pr["id"] for pr in pull_requests if pr])
+            raise GitHubError(f"Failed to create pull requests. Details: {'; '.join(errors) or 'Unknown error'}")
+
+        try:
+            # --- Label and assign all pull requests in one mutation ---
+            # GraphQL rejects declared-but-unused variables, so only declare what is referenced.
+            if label_ids or assignee_ids:
+                params = [f"$pr{i}: ID!" for i in range(len(bases))]
+                fields = ""
+                if label_ids:
+                    params.append("$labelIds: [ID!]!")
+                    fields += "".join(f" labels{i}: addLabelsToLabelable(input: {{labelableId: $pr{i}, labelIds: $labelIds}}) {{ clientMutationId }}" for i in range(len(bases)))
+                if assignee_ids:
+                    params.append("$assigneeIds: [ID!]!")
+                    fields += "".join(f" assignees{i}: addAssigneesToAssignable(input: {{assignableId: $pr{i}, assigneeIds: $assigneeIds}}) {{ clientMutationId }}" for i in range(len(bases)))
+                self._graphql.execute(
+                    f"mutation({', '.join(params)}) {{{fields} }}",
+                    {**({"labelIds": label_ids} if label_ids else {}),
+                     **({"assigneeIds": assignee_ids} if assignee_ids else {}),
+                     **{f"pr{i}": pr["id"] for i, pr in enumerate(pull_requests)}},
+                )
+
+            # Labels that don't exist yet are created by the REST endpoint on first use.
+            if missing_labels:
+                try:
+                    for pr in pull_requests:
+                        repo.get_issue(pr["number"]).add_to_labels(*missing_labels)
+                except GithubException as e:
+                    raise GitHubError(f"Failed to label pull request. Details: {e.data.get('message', 'Unknown error')}")
+        except BaseException:
+            # Nothing has been merged yet, so none of the PRs should stay open
+            self._close([pr["id"] for pr in pull_requests])
+            raise
+
+        # --- Merge one at a time, stopping at the first failure ---
+        for i, (base, pr) in enumerate(zip(bases, pull_requests)):
+            try:
+                self._graphql.execute(
+                    "mutation($id: ID!) { mergePullRequest(input: {pullRequestId: $id}) { pullRequest { merged } } }",
+                    {"id": pr["id"]},
+                )
+            except GitHubError as e:
+                self._close([later["id"] for later in pull_requests[i + 1:]])
+                raise GitHubError(f"Failed to merge pull request into '{base}'. {e}")
+
+        return {base: {"number": pr["number"], "url": pr["url"]} for base, pr in zip(bases, pull_requests)}
+
+    def _close(self, pr_ids: list[str]):
+        """Closes pull requests that were opened but won't be merged, ignoring failures."""
+        if not pr_ids:
+            return
+        params = ", ".join(f"$pr{i}: ID!" for i in range(len(pr_ids)))
+        fields = "".join(f" close{i}: closePullRequest(input: {{pullRequestId: $pr{i}}}) {{ clientMutationId }}" for i in range(len(pr_ids)))
+        try:
+            self._graphql.execute(f"mutation({params}) {{{fields} }}", {f"pr{i}": pr_id for i, pr_id in enumerate(pr_ids)})
+        except GitHubError:
+            pass
@@ -1,13 +1,12 @@
 from github import Github, GithubException, Organization, Repository, UnknownObjectException
-
-# We can keep the custom error here or move it to a shared exceptions file
-class GitHubError(Exception):
-    pass
+from .exceptions import GitHubError
 
 class RepositoryManager:
     def __init__(self, gh: Github, org: Organization):
         self._gh = gh
         self._org = org
+        # Repositories already fetched in this process, keyed by name
+        self._repo_cache: dict[str, Repository.Repository] = {}
 
     def create(self, name: str, description: str, private: bool, readmefile: bool = True) -> 'Repository':
         """Creates a new repository in the configured organization."""
@@ -18,6 +17,7 @@ class RepositoryManager:
                 private=private,
                 auto_init=readmefile,
             )
+            self._repo_cache[name] = repo
             return repo
         except GithubException as e:
             if e.status == 422:
@@ -27,7 +27,8 @@ class RepositoryManager:
             
     def get(self, name: str) -> Repository.Repository:
         """
-        Retrieves a single repository by its name.
+        Retrieves a single repository by its name. Results are cached per
+        manager, so repeated lookups of the same repository are free.
 
         Args:
             name (str): The name of the repository to retrieve.
@@ -38,13 +39,17 @@ class RepositoryManager:
         Raises:
             GitHubError: If the repository is not found.
         """
+        if name in self._repo_cache:
+            return self._repo_cache[name]
         try:
-            return self._org.get_repo(name)
+            repo = self._org.get_repo(name)
         except GithubException as e:
             if e.status == 404:
                 raise GitHubError(f"Repository '{name}' not found in organization '{self._org.login}'.")
             else:
                 raise GitHubError(f"Failed to get repository '{name}'. Details: {e.data.get('message', 'Unknown error')}")
+        self._repo_cache[name] = repo
+        return repo
             
     def edit(self, repo: Repository.Repository, default_branch: str):
         """